@@ -0,0 +1,46 @@
+"""
+Shared input/output handling for hook scripts.
+
+Not a hook itself - imported by the hooks in this directory (the script's
+own directory is on sys.path when Claude Code runs it).
+
+Uses orjson when it's importable and falls back to the standard library,
+so hooks keep working under a bare python3.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def load_input() -> dict | None:
+    """Parse the hook's JSON payload from stdin, or None if it isn't valid JSON."""
+    # Read fd 0 directly - payloads are small, and both parsers take bytes,
+    # so sys.stdin's text decoding layer is pure overhead
+    chunks = []
+    while chunk := os.read(0, 65536):
+        chunks.append(chunk)
+    data = b"".join(chunks)
+    try:
+        return _loads(data)
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+        return None
+
+
+def emit(output: dict) -> None:
+    """Write the hook's JSON response to stdout as UTF-8 bytes."""
+    sys.stdout.buffer.write(_dumps(output))
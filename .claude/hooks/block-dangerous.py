@@ -6,15 +6,83 @@ MINIMAL blocking - only the truly catastrophic stuff.
 Permissions in settings.json handle the rest.
 """
 
-import json
+from __future__ import annotations
+
 import re
 import sys
 
+from _hookio import load_input
+
+# ONLY block patterns that are catastrophic AND unambiguous
+# These patterns must be at the START of the command (not in args/strings),
+# so they are keyed by command name and only the family for the command
+# actually being run is searched.
+# Command, option and shell words match in any case (scoped (?i:...) groups,
+# not a global flag): on case-insensitive filesystems such as macOS's default,
+# "RM -rf /" runs the real rm. The lookup key is lowercased for the same reason.
+_COMMAND_PATTERNS = {
+    # Recursive delete at root or with force - only at command start
+    "rm": {
+        "rm_root": (r"^\s*(?i:rm)\s+-(?i:rf)\s+/\s*$", "Blocked: rm -rf /"),
+        "rm_root_glob": (r"^\s*(?i:rm)\s+-(?i:rf)\s+/\*", "Blocked: rm -rf /*"),
+        "rm_home": (r"^\s*(?i:rm)\s+-(?i:rf)\s+~\s*$", "Blocked: rm -rf ~"),
+    },
+    # Direct pipe to shell from curl/wget (remote code execution)
+    "curl": {
+        "curl_pipe": (
+            r"^\s*(?i:curl)\s+.*\|\s*(?:(?i:sudo)\s+)?(?i:(?:ba)?sh)",
+            "Blocked: curl pipe to shell",
+        ),
+    },
+    "wget": {
+        "wget_pipe": (
+            r"^\s*(?i:wget)\s+.*\|\s*(?:(?i:sudo)\s+)?(?i:(?:ba)?sh)",
+            "Blocked: wget pipe to shell",
+        ),
+    },
+    # Disk operations
+    "mkfs": {
+        "mkfs": (r"^\s*(?i:mkfs)\.", "Blocked: filesystem format"),
+    },
+    "dd": {
+        "dd_disk": (r"^\s*(?i:dd)\s+.*(?i:of)=/dev/[sh]d", "Blocked: dd to disk"),
+    },
+}
+
+# Patterns that are catastrophic wherever they appear in the command
+_ANYWHERE_PATTERNS = {
+    # Fork bomb
+    "fork_bomb": (r":\s*\(\)\s*\{.*:\s*\|", "Blocked: fork bomb"),
+    # Writing to critical system paths
+    "disk_write": (r">\s*/dev/[sh]d[a-z]", "Blocked: write to disk device"),
+}
+
+
+def _fuse(patterns: dict[str, tuple[str, str]]) -> re.Pattern[str]:
+    """Combine named patterns into one alternation scanned in a single pass."""
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, (pattern, _) in patterns.items()))
+
+
+_COMMAND_RES = {command: _fuse(patterns) for command, patterns in _COMMAND_PATTERNS.items()}
+_ANYWHERE_RE = _fuse(_ANYWHERE_PATTERNS)
+_REASONS = {
+    name: reason
+    for patterns in (*_COMMAND_PATTERNS.values(), _ANYWHERE_PATTERNS)
+    for name, (_, reason) in patterns.items()
+}
+
+
+def _command_name(command: str) -> str:
+    """Return the leading command word, e.g. "mkfs" for "mkfs.ext4 /dev/sdb1"."""
+    tokens = command.split(None, 1)
+    if not tokens:
+        return ""
+    return tokens[0].lower().partition(".")[0]
+
 
 def main():
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+    input_data = load_input()
+    if input_data is None:
         sys.exit(0)
 
     tool_name = input_data.get("tool_name", "")
@@ -24,29 +92,13 @@ def main():
     tool_input = input_data.get("tool_input", {})
     command = tool_input.get("command", "")
 
-    # ONLY block patterns that are catastrophic AND unambiguous
-    # These patterns must be at the START of the command (not in args/strings)
-    catastrophic_patterns = [
-        # Recursive delete at root or with force - only at command start
-        (r"^\s*rm\s+-rf\s+/\s*$", "Blocked: rm -rf /"),
-        (r"^\s*rm\s+-rf\s+/\*", "Blocked: rm -rf /*"),
-        (r"^\s*rm\s+-rf\s+~\s*$", "Blocked: rm -rf ~"),
-        # Fork bomb
-        (r":\s*\(\)\s*\{.*:\s*\|", "Blocked: fork bomb"),
-        # Direct pipe to shell from curl/wget (remote code execution)
-        (r"^\s*curl\s+.*\|\s*(?:sudo\s+)?(?:ba)?sh", "Blocked: curl pipe to shell"),
-        (r"^\s*wget\s+.*\|\s*(?:sudo\s+)?(?:ba)?sh", "Blocked: wget pipe to shell"),
-        # Writing to critical system paths
-        (r">\s*/dev/[sh]d[a-z]", "Blocked: write to disk device"),
-        # Disk operations
-        (r"^\s*mkfs\.", "Blocked: filesystem format"),
-        (r"^\s*dd\s+.*of=/dev/[sh]d", "Blocked: dd to disk"),
-    ]
-
-    for pattern, reason in catastrophic_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            print(reason, file=sys.stderr)
-            sys.exit(2)
+    match = _ANYWHERE_RE.search(command)
+    if match is None:
+        command_re = _COMMAND_RES.get(_command_name(command))
+        match = command_re.search(command) if command_re else None
+    if match:
+        print(_REASONS[match.lastgroup], file=sys.stderr)
+        sys.exit(2)
 
     # Allow everything else - permissions handle the rest
     sys.exit(0)
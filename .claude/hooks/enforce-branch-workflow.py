@@ -11,13 +11,38 @@ This ensures the feature branch workflow is followed:
 3. PR to merge into main
 """
 
-import json
+from __future__ import annotations
+
 import subprocess
 import sys
+from pathlib import Path
+
+from _hookio import emit, load_input
+
+
+def _read_head_branch() -> str | None:
+    """
+    Read the branch name straight from .git/HEAD.
+
+    Returns None when HEAD can't be read this way (not at the repo root,
+    worktrees, where .git is a file), so the caller falls back to git.
+    """
+    try:
+        head = Path(".git/HEAD").read_text().strip()
+    except OSError:
+        return None
+    prefix = "ref: refs/heads/"
+    if head.startswith(prefix):
+        return head[len(prefix) :]
+    # Detached HEAD - match `git rev-parse --abbrev-ref HEAD`
+    return "HEAD"
 
 
 def get_current_branch() -> str:
     """Get the current git branch name."""
+    branch = _read_head_branch()
+    if branch is not None:
+        return branch
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -31,9 +56,8 @@ def get_current_branch() -> str:
 
 
 def main():
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+    input_data = load_input()
+    if input_data is None:
         sys.exit(0)
 
     tool_name = input_data.get("tool_name", "")
@@ -69,7 +93,7 @@ Use feature branches for all work:
 Then merge via PR after review.""",
             },
         }
-        print(json.dumps(output))
+        emit(output)
         sys.exit(0)  # Exit 0 when using JSON output
 
     # Allow commits on feature branches
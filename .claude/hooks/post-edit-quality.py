@@ -2,20 +2,65 @@
 """
 Run quality checks after editing Python files.
 
-Runs ruff format and ruff check after Python file edits.
+Runs ruff format and ruff check --fix after Python file edits.
 Non-blocking - reports issues as warnings rather than blocking.
+
+Files that came out clean are remembered by content hash in .claude/cache/,
+so re-saving an unchanged file doesn't pay for another round of uv + ruff.
+The hash also covers the ruff configuration (pyproject.toml) and the locked
+ruff version (uv.lock), so a config change or ruff upgrade re-lints everything.
+Git-ignored files are skipped.
 """
 
-import json
+import hashlib
 import subprocess
 import sys
 from pathlib import Path
 
+from _hookio import emit, load_input
 
-def main():
+CACHE_DIR = Path(".claude/cache/post-edit")
+
+# Files whose contents change what ruff reports for an unchanged source file
+CONFIG_FILES = ("pyproject.toml", "uv.lock")
+
+
+def _cache_marker(file_path: str) -> Path:
+    """Marker file holding the content digest of the last clean check of file_path."""
+    key = hashlib.blake2b(str(Path(file_path).resolve()).encode(), digest_size=8)
+    return CACHE_DIR / key.hexdigest()
+
+
+def _content_digest(file_path: str) -> str:
+    """Digest of file_path's bytes together with the ruff config it was checked under."""
+    digest = hashlib.blake2b(digest_size=16)
+    for config in CONFIG_FILES:
+        try:
+            digest.update(Path(config).read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    digest.update(Path(file_path).read_bytes())
+    return digest.hexdigest()
+
+
+def _is_git_ignored(file_path: str) -> bool:
+    """Whether git ignores file_path - much cheaper than starting uv + ruff."""
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        result = subprocess.run(
+            ["git", "check-ignore", "-q", file_path],
+            capture_output=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    # 0 = ignored, 1 = not ignored, 128 = error (e.g. not a repository)
+    return result.returncode == 0
+
+
+def main():
+    input_data = load_input()
+    if input_data is None:
         sys.exit(0)
 
     tool_input = input_data.get("tool_input", {})
@@ -34,6 +79,17 @@ def main():
     if not Path(file_path).exists():
         sys.exit(0)
 
+    # Skip if the file is byte-identical to the last version that was clean
+    marker = _cache_marker(file_path)
+    try:
+        if marker.read_text() == _content_digest(file_path):
+            sys.exit(0)
+    except OSError:
+        pass
+
+    if _is_git_ignored(file_path):
+        sys.exit(0)
+
     messages = []
     has_errors = False
 
@@ -47,25 +103,26 @@ def main():
     if result.returncode != 0:
         messages.append(f"Format issue: {result.stderr.strip()}")
 
-    # Run ruff check with auto-fix
+    # Run ruff check with auto-fix - it exits non-zero and lists whatever
+    # it couldn't fix, so no separate check pass is needed
     result = subprocess.run(
         ["uv", "run", "ruff", "check", "--fix", file_path],
         capture_output=True,
         text=True,
         timeout=30,
     )
-
-    # Check for remaining lint errors
-    result = subprocess.run(
-        ["uv", "run", "ruff", "check", file_path],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
     if result.returncode != 0 and result.stdout.strip():
         messages.append(f"Lint issues:\n{result.stdout.strip()}")
         has_errors = True
 
+    # Remember the formatted content so an unchanged re-save is skipped
+    if not messages:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            marker.write_text(_content_digest(file_path))
+        except OSError:
+            pass
+
     # Output result - ALWAYS ADVISORY, never block
     if messages:
         # Include severity indicator in the message itself
@@ -78,7 +135,7 @@ def main():
                 "additionalContext": f"{prefix}\n" + "\n".join(messages),
             },
         }
-        print(json.dumps(output))
+        emit(output)
 
     sys.exit(0)
 
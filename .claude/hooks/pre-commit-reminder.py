@@ -6,14 +6,14 @@ Provides a gentle reminder to check quality before committing.
 NEVER blocks - just provides advisory feedback.
 """
 
-import json
 import sys
 
+from _hookio import emit, load_input
+
 
 def main():
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+    input_data = load_input()
+    if input_data is None:
         sys.exit(0)
 
     tool_input = input_data.get("tool_input", {})
@@ -38,7 +38,7 @@ def main():
 This is just a reminder - proceeding with commit.""",
         },
     }
-    print(json.dumps(output))
+    emit(output)
     sys.exit(0)
 
 
@@ -9,42 +9,68 @@ Checks:
 4. Doc freshness: warns if core architecture changed but docs weren't updated
 5. Session handoff reminder for context preservation
 
+A session log is written to .claude/logs/ when there are issues or
+warnings to record (set CLAUDE_LOG_SESSIONS=1 to log every stop).
+
 This hook is advisory - it won't block stopping but will provide warnings.
 """
 
-import json
-import subprocess
+from __future__ import annotations
+
+import asyncio
+import os
 import sys
-from datetime import datetime
-from pathlib import Path
+from io import TextIOWrapper
 
+from _hookio import emit
 
-def run_command(cmd: list[str], timeout: int = 60) -> tuple[int, str, str]:
+
+async def run_command(cmd: list[str], timeout: int = 60) -> tuple[int, str, str]:
     """Run a command and return (returncode, stdout, stderr)."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return 1, "", "Command timed out"
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
     except FileNotFoundError:
         return 1, "", f"Command not found: {cmd[0]}"
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return 1, "", "Command timed out"
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def git_status_and_diff() -> tuple[str, str]:
+    """Return (git status --porcelain, git diff --stat HEAD) output."""
+    _, status, _ = await run_command(["git", "status", "--porcelain"])
+    if not status.strip():
+        # A clean working tree has nothing to diff - skip the extra git fork
+        return status, ""
+    _, diff_stat, _ = await run_command(["git", "diff", "--stat", "HEAD"])
+    return status, diff_stat
 
 
 # Core architecture files that should trigger doc review when changed
-CORE_FILES = {
-    "scholardoc/models.py",
-    "scholardoc/config.py",
-    "scholardoc/__init__.py",
-    "scholardoc/convert.py",
-}
+CORE_FILES = frozenset(
+    {
+        "scholardoc/models.py",
+        "scholardoc/config.py",
+        "scholardoc/__init__.py",
+        "scholardoc/convert.py",
+    }
+)
 
 # Documentation files that should be updated when core architecture changes
-DOC_FILES = {
-    "CLAUDE.md",
-    "README.md",
-    "SPEC.md",
-    "REQUIREMENTS.md",
-}
+DOC_FILES = frozenset(
+    {
+        "CLAUDE.md",
+        "README.md",
+        "SPEC.md",
+        "REQUIREMENTS.md",
+    }
+)
 
 
 def check_doc_freshness(changed_files: list[str]) -> str | None:
@@ -53,42 +79,79 @@ def check_doc_freshness(changed_files: list[str]) -> str | None:
 
     Returns a warning message if docs may need updating, None otherwise.
     """
-    # Parse changed files (git status --porcelain format: "XY filename")
-    modified_paths = set()
-    for line in changed_files:
-        if line.strip():
-            # Handle renamed files (R  old -> new) and normal files
-            parts = line.split()
-            if len(parts) >= 2:
-                path = parts[-1]  # Take the last part (handles renames)
-                modified_paths.add(path)
+    # Parse changed files (git status --porcelain format: "XY filename"),
+    # taking the new name for renames ("R  old -> new")
+    modified_paths = {line[3:].split(" -> ")[-1] for line in changed_files if len(line) > 3}
 
     # Check if any core files were modified
-    core_modified = modified_paths & CORE_FILES
-    if not core_modified:
+    if modified_paths.isdisjoint(CORE_FILES):
         return None
 
     # Check if any doc files were also modified
-    doc_modified = modified_paths & DOC_FILES
-    if doc_modified:
+    if not modified_paths.isdisjoint(DOC_FILES):
         return None  # Docs were updated, all good
 
     # Core changed, docs didn't - warn
-    core_list = ", ".join(sorted(core_modified))
+    core_list = ", ".join(sorted(modified_paths & CORE_FILES))
     return (
         f"📝 Doc freshness check: Core files changed ({core_list}) but no docs updated. "
         f"Review if CLAUDE.md#Vision or other docs need updating."
     )
 
 
-def main():
+def _write_bullets(f: TextIOWrapper, items: list[str]) -> None:
+    """Write items as a markdown bullet list, or "None" if there are none."""
+    if not items:
+        f.write("None\n")
+    for item in items:
+        f.write(f"- {item}\n")
+
+
+def write_session_log(
+    issues: list[str], warnings: list[str], diff_stat: str, recent_commits: str
+) -> None:
+    """Write a session summary to .claude/logs/session_YYYYMMDD_HHMMSS.md."""
+    # Imported here so stops with nothing to log don't pay for them
+    from datetime import datetime
+    from pathlib import Path
+
+    # One timestamp for both the file name and the header, so they agree
+    now = datetime.now()
+    log_dir = Path(".claude/logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / f"session_{now.strftime('%Y%m%d_%H%M%S')}.md"
+
+    with log_file.open("w") as f:
+        f.write(f"# Session Log - {now.isoformat(timespec='seconds')}\n\n")
+        f.write(f"## Status\n- Issues: {len(issues)}\n- Warnings: {len(warnings)}\n\n")
+        f.write("## Changes Since Last Commit\n```\n")
+        f.write(f"{diff_stat[:1000] if diff_stat else 'No changes'}\n```\n\n")
+        f.write("## Recent Commits\n```\n")
+        f.write(f"{recent_commits[:500] if recent_commits else 'No recent commits'}\n```\n\n")
+        f.write("## Issues Found\n")
+        _write_bullets(f, issues)
+        f.write("\n## Warnings\n")
+        _write_bullets(f, warnings)
+
+
+async def main():
     issues = []
     warnings = []
 
-    # Check if tests pass
-    returncode, stdout, stderr = run_command(
-        ["uv", "run", "pytest", "--tb=short", "-q"], timeout=120
+    # All checks are independent subprocesses - run them together so the
+    # git and ruff calls overlap with pytest instead of queueing behind it
+    tests, lint, (status, diff_stat), unpushed, (_, recent_commits, _) = await asyncio.gather(
+        run_command(["uv", "run", "pytest", "--tb=short", "-q"], timeout=120),
+        run_command(
+            ["uv", "run", "ruff", "check", "--output-format=concise", "scholardoc/", "tests/"]
+        ),
+        git_status_and_diff(),
+        run_command(["git", "rev-list", "--count", "@{upstream}..HEAD"]),
+        run_command(["git", "log", "--oneline", "-5"]),
     )
+
+    # Check if tests pass
+    returncode, stdout, stderr = tests
     if returncode != 0:
         # Only report if there are actual test failures, not just no tests
         if "no tests ran" not in stdout.lower() and "collected 0 items" not in stdout:
@@ -97,20 +160,15 @@ def main():
             issues.append(f"Test error:\n{stderr[:500]}")
 
     # Check for lint errors (only production code, not exploratory spikes)
-    returncode, stdout, stderr = run_command(
-        ["uv", "run", "ruff", "check", "scholardoc/", "tests/"]
-    )
+    returncode, stdout, stderr = lint
     if returncode != 0 and stdout.strip():
         issues.append(f"Lint errors:\n{stdout[:500]}")
 
     # Check for uncommitted changes
-    returncode, stdout, stderr = run_command(["git", "status", "--porcelain"])
-    if stdout.strip():
-        changed_files = stdout.strip().split("\n")
+    if status.strip():
+        changed_files = status.splitlines()
         file_count = len(changed_files)
-        warnings.append(
-            f"Uncommitted changes ({file_count} files). Consider committing your work."
-        )
+        warnings.append(f"Uncommitted changes ({file_count} files). Consider committing your work.")
 
         # Check doc freshness when there are uncommitted changes
         doc_warning = check_doc_freshness(changed_files)
@@ -118,9 +176,7 @@ def main():
             warnings.append(doc_warning)
 
     # Check for unpushed commits
-    returncode, stdout, stderr = run_command(
-        ["git", "rev-list", "--count", "@{upstream}..HEAD"]
-    )
+    returncode, stdout, stderr = unpushed
     if returncode == 0 and stdout.strip():
         unpushed_count = int(stdout.strip())
         if unpushed_count > 0:
@@ -135,39 +191,10 @@ def main():
     # Note: Handoff reminder removed - Stop hook fires on every response,
     # not just session end. Use /project:checkpoint for explicit handoffs.
 
-    # Log session end
-    log_dir = Path(".claude/logs")
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-
-    # Get summary of changes
-    _, diff_stat, _ = run_command(["git", "diff", "--stat", "HEAD"])
-    _, recent_commits, _ = run_command(["git", "log", "--oneline", "-5"])
-
-    log_content = f"""# Session Log - {datetime.now().isoformat()}
-
-## Status
-- Issues: {len(issues)}
-- Warnings: {len(warnings)}
-
-## Changes Since Last Commit
-```
-{diff_stat[:1000] if diff_stat else "No changes"}
-```
-
-## Recent Commits
-```
-{recent_commits[:500] if recent_commits else "No recent commits"}
-```
-
-## Issues Found
-{chr(10).join(f"- {i}" for i in issues) if issues else "None"}
-
-## Warnings
-{chr(10).join(f"- {w}" for w in warnings) if warnings else "None"}
-"""
-
-    log_file.write_text(log_content)
+    # Log session end - only when there's something to record, unless
+    # CLAUDE_LOG_SESSIONS asks for a log on every stop
+    if issues or warnings or os.environ.get("CLAUDE_LOG_SESSIONS"):
+        write_session_log(issues, warnings, diff_stat, recent_commits)
 
     # Build output - Stop hooks don't support hookSpecificOutput
     # Only output if there are actual issues/warnings worth noting
@@ -179,11 +206,11 @@ def main():
             "continue": True,  # Don't block stopping, just inform
             "systemMessage": "Stop hook notes:\n" + "\n".join(all_messages),
         }
-        print(json.dumps(output))
+        emit(output)
     # else: stay silent - no need to announce "all checks passed" every response
 
     sys.exit(0)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
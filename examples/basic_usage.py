@@ -133,15 +133,16 @@ def batch_conversion_example():
     pdf_dir = Path("pdfs/")
     pdfs = list(pdf_dir.glob("*.pdf"))
 
-    # Convert all PDFs, continuing on errors
-    results = convert_batch(pdfs, on_error="skip")
+    # Convert all PDFs across worker processes; results stream back in order
+    # with only a few in flight, so save each document before taking the next
+    results = convert_batch(pdfs, ConversionConfig(on_extraction_error="raise"), parallel=True)
 
-    for path, doc in results.items():
-        if doc is not None:
-            print(f"{path.name}: {len(doc.pages)} pages")
-            doc.save(f"output/{path.stem}.scholardoc")
+    for path, result in results:
+        if isinstance(result, Exception):
+            print(f"{path.name}: FAILED ({result})")
         else:
-            print(f"{path.name}: FAILED")
+            print(f"{path.name}: {len(result.pages)} pages")
+            result.save(f"output/{path.stem}.scholardoc")
 
 
 def rag_pipeline_example():
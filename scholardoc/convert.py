@@ -15,8 +15,13 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -417,15 +422,32 @@ def convert(
             raise ExtractionError(f"Failed to convert {source}: {e}") from e
 
 
+def _convert_one(
+    source: str | Path, config: ConversionConfig
+) -> tuple[Path, ScholarDocument | Exception]:
+    """Convert one document for convert_batch, returning errors instead of raising."""
+    source = Path(source)
+    try:
+        return source, convert(source, config)
+    except Exception as e:
+        return source, e
+
+
 def convert_batch(
     sources: list[str | Path],
     config: ConversionConfig | None = None,
     parallel: bool = False,
     max_workers: int = 4,
-):
+) -> Iterator[tuple[Path, ScholarDocument | Exception]]:
     """
     Convert multiple documents, yielding results as completed.
 
+    With parallel=True each document is converted in a separate worker
+    process (PDF parsing is CPU-bound, so threads would serialize on the
+    GIL). Results are still yielded in input order, and only a few
+    documents per worker are in flight at once, so a caller that saves
+    each document before taking the next never holds the whole batch.
+
     Args:
         sources: Paths to document files
         config: Conversion configuration
@@ -437,19 +459,55 @@ def convert_batch(
     """
     config = config or ConversionConfig()
 
-    if parallel:
-        # TODO: Implement parallel processing in future
-        logger.warning("Parallel processing not yet implemented, falling back to sequential")
+    if parallel and len(sources) > 1:
+        workers = min(max_workers, len(sources))
+        yield from _filter_skipped(_convert_parallel(sources, config, workers), config)
+        return
 
-    for source in sources:
-        source = Path(source)
-        try:
-            doc = convert(source, config)
-            yield (source, doc)
-        except Exception as e:
-            if config.on_extraction_error == "skip":
-                continue
-            yield (source, e)
+    yield from _filter_skipped(map(_convert_one, sources, repeat(config)), config)
+
+
+def _convert_parallel(
+    sources: list[str | Path], config: ConversionConfig, workers: int
+) -> Iterator[tuple[Path, ScholarDocument | Exception]]:
+    """Convert sources in worker processes, yielding results in input order.
+
+    Keeps at most two conversions per worker in flight: a finished document
+    waits only for the caller to take it, not for the rest of the batch.
+    A worker that dies (e.g. PyMuPDF crashing on a malformed PDF) breaks
+    the pool; the affected sources are yielded as BrokenProcessPool errors.
+    """
+    pending: deque[tuple[Path, Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for source in sources:
+            if len(pending) >= 2 * workers:
+                yield _parallel_result(*pending.popleft())
+            try:
+                future = executor.submit(_convert_one, source, config)
+            except BrokenProcessPool as e:
+                future = Future()
+                future.set_exception(e)
+            pending.append((Path(source), future))
+        while pending:
+            yield _parallel_result(*pending.popleft())
+
+
+def _parallel_result(source: Path, future: Future) -> tuple[Path, ScholarDocument | Exception]:
+    """Wait for one worker result, reporting a broken pool as a per-file error."""
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        return source, e
+
+
+def _filter_skipped(
+    results: Iterator[tuple[Path, ScholarDocument | Exception]], config: ConversionConfig
+) -> Iterator[tuple[Path, ScholarDocument | Exception]]:
+    """Drop failed conversions when on_extraction_error="skip"."""
+    for source, result in results:
+        if isinstance(result, Exception) and config.on_extraction_error == "skip":
+            continue
+        yield source, result
 
 
 def detect_format(path: str | Path) -> str:
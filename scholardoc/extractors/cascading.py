@@ -14,7 +14,9 @@ Supports profile-based configuration for different document types.
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from typing import TYPE_CHECKING
@@ -29,6 +31,7 @@ from scholardoc.extractors.sources import (
 )
 from scholardoc.extractors.validators import (
     HierarchyValidator,
+    MinimumContentValidator,
     NoOverlapValidator,
     TitleQualityValidator,
     ValidationIssue,
@@ -119,8 +122,6 @@ class CascadingExtractor:
 
     def _configure_from_profile(self, profile: DocumentProfile) -> None:
         """Configure extractor from profile settings."""
-        from scholardoc.extractors.validators import MinimumContentValidator
-
         # Sources
         self.outline_source = PDFOutlineSource() if profile.use_outline else None
         self.heading_source = HeadingDetectionSource() if profile.use_heading_detection else None
@@ -279,12 +280,21 @@ class CascadingExtractor:
         # Sort by position
         sorted_candidates = sorted(filtered, key=lambda c: c.start)
 
+        # Index ToC entries by page once, so each candidate only compares
+        # against entries on its own and adjacent pages. Each entry gets one
+        # SequenceMatcher with its title as the cached "b" sequence, reused
+        # for every candidate instead of re-indexing the title per pair.
+        toc_by_page: dict[int, list[tuple[int, str, SequenceMatcher]]] = defaultdict(list)
+        for index, entry in enumerate(toc):
+            matcher = SequenceMatcher(None, b=entry.title.lower())
+            toc_by_page[entry.page_index].append((index, entry.title, matcher))
+
         # Create sections with enriched titles
         sections = []
         for i, candidate in enumerate(sorted_candidates):
             # Try to enrich title from ToC
             title = candidate.title
-            enriched = self._enrich_title(candidate, toc)
+            enriched = self._enrich_title(candidate, toc_by_page)
             if enriched and enriched != title:
                 log.append(f"Enriched title: '{title}' -> '{enriched}'")
                 title = enriched
@@ -310,33 +320,42 @@ class CascadingExtractor:
     def _enrich_title(
         self,
         candidate: SectionCandidate,
-        toc_candidates: list[SectionCandidate],
+        toc_by_page: dict[int, list[tuple[int, str, SequenceMatcher]]],
     ) -> str | None:
         """Try to find a better title from ToC entries.
 
         ToC entries often have cleaner formatting than detected headings.
+
+        Args:
+            candidate: Section candidate whose title may be replaced.
+            toc_by_page: ToC entries keyed by page index, as (position in
+                ToC list, title, matcher primed with the lowercased title).
         """
-        if not toc_candidates:
+        if not toc_by_page:
             return None
 
         best_match = None
         best_ratio = 0.0
 
-        for toc in toc_candidates:
-            # Must be on same or adjacent page
-            if abs(toc.page_index - candidate.page_index) > 1:
+        # Must be on same or adjacent page. Merging the page buckets by ToC
+        # position keeps the original tie-breaking (earliest entry wins).
+        page = candidate.page_index
+        nearby = heapq.merge(*(toc_by_page.get(p, ()) for p in (page - 1, page, page + 1)))
+        title = candidate.title.lower()
+        threshold = self.title_threshold
+
+        for _, toc_title, matcher in nearby:
+            # Compare titles. real_quick_ratio() and quick_ratio() are cheap
+            # upper bounds on ratio(), so pairs that cannot reach the
+            # threshold skip the full comparison.
+            matcher.set_seq1(title)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
                 continue
+            ratio = matcher.ratio()
 
-            # Compare titles
-            ratio = SequenceMatcher(
-                None,
-                candidate.title.lower(),
-                toc.title.lower(),
-            ).ratio()
-
-            if ratio > best_ratio and ratio >= self.title_threshold:
+            if ratio > best_ratio and ratio >= threshold:
                 best_ratio = ratio
-                best_match = toc.title
+                best_match = toc_title
 
         return best_match
 
@@ -21,8 +21,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from scholardoc.readers.pdf_reader import RawDocument, TextBlock
 
+# ToC patterns, applied to every line of every candidate ToC page
+DOTTED_LEADER_PATTERN = re.compile(r"\.{3,}")
+TRAILING_PAGE_NUMBER_PATTERN = re.compile(r"\d+\s*$")
+DOTTED_ENTRY_PATTERN = re.compile(r"^(.+?)\s*\.{3,}\s*(\d+)\s*$")
+SPACED_ENTRY_PATTERN = re.compile(r"^(.+?)\s{2,}(\d+)\s*$")
+CHAPTER_MARKER_PATTERN = re.compile(r"^(chapter|part)\s+", re.IGNORECASE)
+NUMBERED_SECTION_PATTERN = re.compile(r"^\d+\.\d+")
 
-@dataclass
+
+@dataclass(slots=True)
 class SectionCandidate:
     """A proposed section from a detection source.
 
@@ -158,7 +166,9 @@ class HeadingDetectionSource(CandidateSource):
 
         candidates = []
         for block, page_idx in all_blocks:
-            score, evidence = self._heading_score(block, median_size, mad)
+            z_score = (block.font_size - median_size) / mad if mad > 0 else None
+            signals = self._heading_signals(block, z_score)
+            score = min(1.0, sum(weight for _, weight in signals))
 
             if score >= self.min_confidence:
                 level = self._estimate_level(block.font_size, large_sizes)
@@ -179,56 +189,61 @@ class HeadingDetectionSource(CandidateSource):
                         confidence=confidence,
                         source=self.name,
                         page_index=page_idx,
-                        evidence=evidence,
+                        evidence=self._heading_evidence(block, z_score, signals),
                     )
                 )
 
         return candidates
 
-    def _heading_score(
-        self, block: TextBlock, median_size: float, mad: float
-    ) -> tuple[float, dict]:
-        """Score likelihood that block is a heading.
+    def _heading_signals(self, block: TextBlock, z_score: float | None) -> list[tuple[str, float]]:
+        """Score each heading signal present in a block.
 
-        Returns (score, evidence dict).
+        Returns (name, weight) pairs for the signals that fired; the
+        heading score is the (capped) sum of the weights.
         """
-        scores = []
-        evidence = {
-            "font_size": block.font_size,
-            "is_bold": block.is_bold,
-            "is_italic": block.is_italic,
-        }
+        signals = []
 
         # Font size outlier (larger = more likely heading)
-        if mad > 0:
-            z_score = (block.font_size - median_size) / mad
-            evidence["z_score"] = round(z_score, 2)
-            if z_score > self.z_score_threshold:
-                scores.append(min(0.4, z_score / 5))
+        if z_score is not None and z_score > self.z_score_threshold:
+            signals.append(("z_score", min(0.4, z_score / 5)))
 
         # Bold text is strong indicator
         if block.is_bold:
-            scores.append(0.3)
+            signals.append(("is_bold", 0.3))
 
         # Short lines (headings rarely wrap)
         if len(block.text) < 100:
-            scores.append(0.15)
-            evidence["short_line"] = True
+            signals.append(("short_line", 0.15))
 
         # ALL CAPS
         if block.text.isupper() and len(block.text) > 3:
-            scores.append(0.2)
-            evidence["all_caps"] = True
+            signals.append(("all_caps", 0.2))
 
         # Title Case (but not if just 1-2 words)
         if block.text.istitle() and len(block.text.split()) >= 2:
-            scores.append(0.1)
-            evidence["title_case"] = True
+            signals.append(("title_case", 0.1))
 
-        total_score = sum(scores)
-        evidence["component_scores"] = scores
+        return signals
 
-        return min(1.0, total_score), evidence
+    def _heading_evidence(
+        self, block: TextBlock, z_score: float | None, signals: list[tuple[str, float]]
+    ) -> dict:
+        """Describe the heading signals behind a block's score.
+
+        Only built for blocks that become candidates; body text blocks,
+        the vast majority, never need it.
+        """
+        evidence = {
+            "font_size": block.font_size,
+            "is_bold": block.is_bold,
+            "is_italic": block.is_italic,
+        }
+        if z_score is not None:
+            evidence["z_score"] = round(z_score, 2)
+        for name, _ in signals:
+            evidence.setdefault(name, True)
+        evidence["component_scores"] = [weight for _, weight in signals]
+        return evidence
 
     def _estimate_level(self, font_size: float, large_sizes: list[float]) -> int:
         """Estimate heading level from font size."""
@@ -296,11 +311,13 @@ class ToCParserSource(CandidateSource):
         if not entries:
             return []
 
-        # Step 3: Resolve page references to positions
+        # Step 3: Resolve page references to positions. Labels are indexed
+        # once; built in reverse so a repeated label maps to its first page.
+        index_by_label = {page.label: page.index for page in reversed(doc.pages)}
         candidates = []
         for title, page_ref, level in entries:
             # Try to find page by label
-            target_page_idx = self._resolve_page_reference(doc, page_ref)
+            target_page_idx = self._resolve_page_reference(doc, page_ref, index_by_label)
             if target_page_idx is not None:
                 position = doc.position_to_page(target_page_idx)
                 candidates.append(
@@ -349,13 +366,13 @@ class ToCParserSource(CandidateSource):
             scores.append(0.3)
 
         # Dotted leaders (e.g., "Chapter 1 ......... 1")
-        if re.search(r"\.{3,}", text):
+        if DOTTED_LEADER_PATTERN.search(text):
             scores.append(0.3)
 
         # Page number references at end of lines
         lines = text.strip().split("\n")
         lines_with_page_refs = sum(
-            1 for line in lines if re.search(r"\d+\s*$", line.strip())
+            1 for line in lines if TRAILING_PAGE_NUMBER_PATTERN.search(line.strip())
         )
         if lines and lines_with_page_refs / len(lines) > 0.3:
             scores.append(0.3)
@@ -379,7 +396,7 @@ class ToCParserSource(CandidateSource):
 
             # Try to match: "Title ... page_number" or "Title page_number"
             # Pattern 1: Dotted leaders
-            match = re.match(r"^(.+?)\s*\.{3,}\s*(\d+)\s*$", line)
+            match = DOTTED_ENTRY_PATTERN.match(line)
             if match:
                 title, page_ref = match.groups()
                 level = self._estimate_entry_level(title)
@@ -387,7 +404,7 @@ class ToCParserSource(CandidateSource):
                 continue
 
             # Pattern 2: Title followed by page number (whitespace separated)
-            match = re.match(r"^(.+?)\s{2,}(\d+)\s*$", line)
+            match = SPACED_ENTRY_PATTERN.match(line)
             if match:
                 title, page_ref = match.groups()
                 # Filter out lines that are too short to be titles
@@ -410,17 +427,24 @@ class ToCParserSource(CandidateSource):
             return 2  # Section
 
         # Check for chapter/section markers
-        if re.match(r"^(chapter|part)\s+", cleaned, re.IGNORECASE):
+        if CHAPTER_MARKER_PATTERN.match(cleaned):
             return 1
-        if re.match(r"^\d+\.\d+", cleaned):
+        if NUMBERED_SECTION_PATTERN.match(cleaned):
             return 2
 
         return 1  # Default to chapter level
 
-    def _resolve_page_reference(self, doc: RawDocument, page_ref: str) -> int | None:
+    def _resolve_page_reference(
+        self, doc: RawDocument, page_ref: str, index_by_label: dict[str, int]
+    ) -> int | None:
         """Resolve a page reference string to page index.
 
         Handles numeric references and tries to match page labels.
+
+        Args:
+            doc: Document the reference points into.
+            page_ref: Page reference as printed in the ToC.
+            index_by_label: Page index for each page label in the document.
         """
         # Try direct numeric interpretation
         try:
@@ -432,8 +456,4 @@ class ToCParserSource(CandidateSource):
             pass
 
         # Try matching page labels
-        for page in doc.pages:
-            if page.label == page_ref:
-                return page.index
-
-        return None
+        return index_by_label.get(page_ref)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from scholardoc.models import SectionSpan
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A validation problem found in extracted structure."""
 
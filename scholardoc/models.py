@@ -22,11 +22,13 @@ Example:
 from __future__ import annotations
 
 import json
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -97,7 +99,7 @@ class OCRErrorType(Enum):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Span:
     """Base class for position spans in text."""
 
@@ -127,7 +129,7 @@ class Span:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FootnoteRef:
     """A footnote marker that was removed from text."""
 
@@ -136,7 +138,7 @@ class FootnoteRef:
     target_id: str  # Reference to notes dict (e.g., "fn1")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndnoteRef:
     """An endnote marker that was removed from text."""
 
@@ -145,7 +147,7 @@ class EndnoteRef:
     target_id: str  # Reference to notes dict (e.g., "en1")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CitationRef:
     """An in-text citation."""
 
@@ -156,7 +158,7 @@ class CitationRef:
     bib_entry_id: str | None = None  # Link to bibliography entry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedCitation:
     """Structured citation data."""
 
@@ -166,7 +168,7 @@ class ParsedCitation:
     style: str = "unknown"  # "chicago", "mla", "apa", "numeric"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CrossRef:
     """A cross-reference to another part of the document."""
 
@@ -183,7 +185,7 @@ class CrossRef:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageSpan(Span):
     """A page boundary in the text."""
 
@@ -191,7 +193,7 @@ class PageSpan(Span):
     index: int = 0  # 0-based page index in source PDF
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionSpan(Span):
     """A section/chapter boundary in the text."""
 
@@ -200,14 +202,14 @@ class SectionSpan(Span):
     confidence: float = 1.0  # Detection confidence (0.0-1.0)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParagraphSpan(Span):
     """A paragraph boundary in the text."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockQuoteSpan(Span):
     """An indented quotation in the text."""
 
@@ -219,7 +221,7 @@ class BlockQuoteSpan(Span):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """The actual content of a footnote/endnote."""
 
@@ -230,7 +232,7 @@ class Note:
     source: NoteSource = NoteSource.AUTHOR
 
 
-@dataclass
+@dataclass(slots=True)
 class BibEntry:
     """A parsed bibliography entry."""
 
@@ -250,7 +252,7 @@ class BibEntry:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class ToCEntry:
     """An entry from the Table of Contents."""
 
@@ -275,7 +277,7 @@ class TableOfContents:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRCorrectionRecord:
     """Record of an OCR correction (for debugging/analysis)."""
 
@@ -288,7 +290,7 @@ class OCRCorrectionRecord:
     method: str = ""  # e.g., "reocr_doctr", "reocr_tesseract"
 
 
-@dataclass
+@dataclass(slots=True)
 class PageQuality:
     """Quality assessment for a single page."""
 
@@ -424,7 +426,7 @@ class DocumentMetadata:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGChunk:
     """A chunk ready for embedding."""
 
@@ -561,14 +563,17 @@ class ScholarDocument:
 
     def page_for_position(self, pos: int) -> PageSpan | None:
         """Which page contains this position?"""
-        for page in self.pages:
-            if page.start <= pos < page.end:
-                return page
+        pages, starts, _ = self._page_index
+        i = bisect_right(starts, pos) - 1
+        if i >= 0 and pos < pages[i].end:
+            return pages[i]
         return None
 
     def pages_in_range(self, start: int, end: int) -> list[PageSpan]:
         """Get all pages overlapping a range."""
-        return [p for p in self.pages if p.start < end and start < p.end]
+        pages, starts, ends = self._page_index
+        # Pages ending after `start` up to pages starting before `end`
+        return pages[bisect_right(ends, start) : bisect_left(starts, end)]
 
     def section_for_position(self, pos: int) -> SectionSpan | None:
         """Which section contains this position?"""
@@ -584,13 +589,12 @@ class ScholarDocument:
         return [s for s in self.sections if s.start < end and start < s.end]
 
     def footnotes_in_range(self, start: int, end: int) -> list[tuple[FootnoteRef, Note]]:
-        """Get footnotes referenced in a text range with their content."""
+        """Get footnotes referenced in a text range with their content, in position order."""
         result = []
-        for fn in self.footnote_refs:
-            if start <= fn.position < end:
-                note = self.notes.get(fn.target_id)
-                if note:
-                    result.append((fn, note))
+        for fn in self._footnotes_in_range_refs(start, end):
+            note = self.notes.get(fn.target_id)
+            if note:
+                result.append((fn, note))
         return result
 
     def citations_in_range(self, start: int, end: int) -> list[CitationRef]:
@@ -609,12 +613,32 @@ class ScholarDocument:
     @cached_property
     def section_titles(self) -> list[str]:
         """List of section titles in order."""
-        return [s.title for s in sorted(self.sections, key=lambda s: s.start)]
+        return [s.title for s in sorted(self.sections, key=attrgetter("start"))]
 
     @cached_property
     def page_labels(self) -> list[str]:
         """List of page labels in order."""
-        return [p.label for p in sorted(self.pages, key=lambda p: p.start)]
+        return [p.label for p in self._page_index[0]]
+
+    @cached_property
+    def _page_index(self) -> tuple[list[PageSpan], list[int], list[int]]:
+        """Pages sorted by position, with their start and end offsets.
+
+        Pages never overlap, so both offset lists are sorted and position
+        lookups can bisect instead of scanning every page.
+        """
+        pages = sorted(self.pages, key=attrgetter("start"))
+        return pages, [p.start for p in pages], [p.end for p in pages]
+
+    @cached_property
+    def _footnote_index(self) -> tuple[list[FootnoteRef], list[int]]:
+        """Footnote refs sorted by position, with their positions.
+
+        Chunking asks for the refs in every chunk's range; bisecting the
+        sorted positions avoids rescanning all refs per chunk.
+        """
+        refs = sorted(self.footnote_refs, key=attrgetter("position"))
+        return refs, [fn.position for fn in refs]
 
     # ─────────────────────────────────────────────────
     # Common Exports (no deps, universal need)
@@ -653,7 +677,7 @@ class ScholarDocument:
         if include_page_markers and self.pages:
             # Insert page markers at appropriate positions
             current_pos = 0
-            for page in sorted(self.pages, key=lambda p: p.start):
+            for page in self._page_index[0]:
                 if page.start > current_pos:
                     lines.append(self.text[current_pos : page.start])
                 if page_marker_style == "comment":
@@ -712,7 +736,7 @@ class ScholarDocument:
     def _chunk_by_page(self) -> Iterator[RAGChunk]:
         """Generate one chunk per page."""
         prev_id = None
-        for i, page in enumerate(sorted(self.pages, key=lambda p: p.start)):
+        for i, page in enumerate(self._page_index[0]):
             chunk_id = f"page_{page.label}"
             chunk = RAGChunk(
                 text=self.text[page.start : page.end],
@@ -736,7 +760,7 @@ class ScholarDocument:
     def _chunk_by_section(self) -> Iterator[RAGChunk]:
         """Generate one chunk per section."""
         prev_id = None
-        for i, section in enumerate(sorted(self.sections, key=lambda s: s.start)):
+        for i, section in enumerate(sorted(self.sections, key=attrgetter("start"))):
             chunk_id = f"section_{i}_{section.title[:20].replace(' ', '_')}"
             pages = self.pages_in_range(section.start, section.end)
             chunk = RAGChunk(
@@ -763,20 +787,27 @@ class ScholarDocument:
             return
 
         current_start = 0
-        current_text = ""
+        # Pieces of the current chunk, joined once when it is emitted
+        current_parts: list[str] = []
+        current_len = 0
         chunk_index = 0
         prev_id = None
 
-        for para in sorted(self.paragraphs, key=lambda p: p.start):
+        for para in sorted(self.paragraphs, key=attrgetter("start")):
             para_text = self.text[para.start : para.end]
 
             # Would adding this paragraph exceed max?
-            if len(current_text) + len(para_text) > max_chars and current_text:
+            if current_len + len(para_text) > max_chars and current_len:
                 # Emit current chunk
                 chunk_id = f"chunk_{chunk_index}"
                 current_end = para.start
                 yield self._make_chunk(
-                    chunk_id, chunk_index, current_start, current_end, current_text, prev_id
+                    chunk_id,
+                    chunk_index,
+                    current_start,
+                    current_end,
+                    "".join(current_parts),
+                    prev_id,
                 )
                 prev_id = chunk_id
                 chunk_index += 1
@@ -784,15 +815,23 @@ class ScholarDocument:
                 # Start new chunk with overlap
                 overlap_start = max(0, current_end - overlap)
                 current_start = overlap_start
-                current_text = self.text[overlap_start:current_end]
+                overlap_text = self.text[overlap_start:current_end]
+                current_parts = [overlap_text]
+                current_len = len(overlap_text)
 
-            current_text += para_text
+            current_parts.append(para_text)
+            current_len += len(para_text)
 
         # Emit final chunk
-        if current_text:
+        if current_len:
             chunk_id = f"chunk_{chunk_index}"
             yield self._make_chunk(
-                chunk_id, chunk_index, current_start, len(self.text), current_text, prev_id
+                chunk_id,
+                chunk_index,
+                current_start,
+                len(self.text),
+                "".join(current_parts),
+                prev_id,
             )
 
     def _chunk_fixed_size(self, max_chars: int, overlap: int) -> Iterator[RAGChunk]:
@@ -846,16 +885,15 @@ class ScholarDocument:
         return None
 
     def _footnotes_in_range_refs(self, start: int, end: int) -> Iterator[FootnoteRef]:
-        """Get footnote refs in range."""
-        for fn in self.footnote_refs:
-            if start <= fn.position < end:
-                yield fn
+        """Get footnote refs in range, in position order."""
+        refs, positions = self._footnote_index
+        yield from refs[bisect_left(positions, start) : bisect_left(positions, end)]
 
     # ─────────────────────────────────────────────────
     # Persistence
     # ─────────────────────────────────────────────────
 
-    def save(self, path: Path | str) -> None:
+    def save(self, path: Path | str, compact: bool = False) -> None:
         """
         Save to .scholardoc (JSON) format.
 
@@ -863,14 +901,17 @@ class ScholarDocument:
 
         Args:
             path: Output file path
+            compact: Write without indentation or padding. Smaller and faster
+                to write; intended for files only read back by load().
         """
         path = Path(path)
         if not path.suffix:
             path = path.with_suffix(".scholardoc")
 
         data = self._to_dict()
+        layout = {"separators": (",", ":")} if compact else {"indent": 2}
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            json.dump(data, f, ensure_ascii=False, default=str, **layout)
 
     @classmethod
     def load(cls, path: Path | str) -> ScholarDocument:
@@ -1221,7 +1262,11 @@ class ScholarDocument:
         conn.execute("CREATE INDEX idx_footnotes_pos ON footnote_refs(position)")
 
     def _write_sqlite_data(self, conn) -> None:
-        """Write document data to SQLite tables."""
+        """Write document data to SQLite tables.
+
+        Rows are passed to executemany as generators so each table is
+        streamed into SQLite without building a list of row tuples first.
+        """
         # Metadata
         meta_items = [
             ("version", "1.0"),
@@ -1242,61 +1287,61 @@ class ScholarDocument:
         # Annotations
         conn.executemany(
             "INSERT INTO footnote_refs VALUES (?, ?, ?)",
-            [(fn.position, fn.marker, fn.target_id) for fn in self.footnote_refs],
+            ((fn.position, fn.marker, fn.target_id) for fn in self.footnote_refs),
         )
         conn.executemany(
             "INSERT INTO endnote_refs VALUES (?, ?, ?)",
-            [(en.position, en.marker, en.target_id) for en in self.endnote_refs],
+            ((en.position, en.marker, en.target_id) for en in self.endnote_refs),
         )
         conn.executemany(
             "INSERT INTO citations VALUES (?, ?, ?, ?)",
-            [(c.start, c.end, c.original, c.bib_entry_id) for c in self.citations],
+            ((c.start, c.end, c.original, c.bib_entry_id) for c in self.citations),
         )
         conn.executemany(
             "INSERT INTO cross_refs VALUES (?, ?, ?, ?, ?)",
-            [
+            (
                 (cr.start, cr.end, cr.original, cr.target_page, cr.target_section)
                 for cr in self.cross_refs
-            ],
+            ),
         )
 
         # Structural spans
         conn.executemany(
             "INSERT INTO pages VALUES (?, ?, ?, ?)",
-            [(p.start, p.end, p.label, p.index) for p in self.pages],
+            ((p.start, p.end, p.label, p.index) for p in self.pages),
         )
         conn.executemany(
             "INSERT INTO sections VALUES (?, ?, ?, ?, ?)",
-            [(s.start, s.end, s.title, s.level, s.confidence) for s in self.sections],
+            ((s.start, s.end, s.title, s.level, s.confidence) for s in self.sections),
         )
         conn.executemany(
             "INSERT INTO paragraphs VALUES (?, ?)",
-            [(p.start, p.end) for p in self.paragraphs],
+            ((p.start, p.end) for p in self.paragraphs),
         )
         conn.executemany(
             "INSERT INTO block_quotes VALUES (?, ?, ?)",
-            [(b.start, b.end, b.indentation_level) for b in self.block_quotes],
+            ((b.start, b.end, b.indentation_level) for b in self.block_quotes),
         )
 
         # Notes
         conn.executemany(
             "INSERT INTO notes VALUES (?, ?, ?, ?, ?)",
-            [
+            (
                 (n.id, n.text, n.note_type.value, n.page_label, n.source.value)
                 for n in self.notes.values()
-            ],
+            ),
         )
 
         # Bibliography
         conn.executemany(
             "INSERT INTO bibliography VALUES (?, ?, ?, ?, ?)",
-            [(b.id, b.raw, json.dumps(b.authors), b.title, b.year) for b in self.bibliography],
+            ((b.id, b.raw, json.dumps(b.authors), b.title, b.year) for b in self.bibliography),
         )
 
         # Processing log
         conn.executemany(
             "INSERT INTO processing_log VALUES (?, ?)",
-            [(i, entry) for i, entry in enumerate(self.processing_log)],
+            enumerate(self.processing_log),
         )
 
         # ToC entries (recursive structure flattened)
@@ -1339,7 +1384,7 @@ class ScholarDocument:
     def _read_sqlite_data(cls, conn) -> ScholarDocument:
         """Read document data from SQLite tables."""
         # Metadata
-        meta = dict(conn.execute("SELECT key, value FROM metadata").fetchall())
+        meta = dict(conn.execute("SELECT key, value FROM metadata"))
 
         # Content
         text = conn.execute("SELECT text FROM content").fetchone()[0]
@@ -1347,11 +1392,11 @@ class ScholarDocument:
         # Annotations
         footnote_refs = [
             FootnoteRef(position=r["position"], marker=r["marker"], target_id=r["target_id"])
-            for r in conn.execute("SELECT * FROM footnote_refs").fetchall()
+            for r in conn.execute("SELECT * FROM footnote_refs")
         ]
         endnote_refs = [
             EndnoteRef(position=r["position"], marker=r["marker"], target_id=r["target_id"])
-            for r in conn.execute("SELECT * FROM endnote_refs").fetchall()
+            for r in conn.execute("SELECT * FROM endnote_refs")
         ]
         citations = [
             CitationRef(
@@ -1360,7 +1405,7 @@ class ScholarDocument:
                 original=r["original"],
                 bib_entry_id=r["bib_entry_id"],
             )
-            for r in conn.execute("SELECT * FROM citations").fetchall()
+            for r in conn.execute("SELECT * FROM citations")
         ]
         cross_refs = [
             CrossRef(
@@ -1370,13 +1415,13 @@ class ScholarDocument:
                 target_page=r["target_page"],
                 target_section=r["target_section"],
             )
-            for r in conn.execute("SELECT * FROM cross_refs").fetchall()
+            for r in conn.execute("SELECT * FROM cross_refs")
         ]
 
         # Structural spans
         pages = [
             PageSpan(start=r["start"], end=r["end_pos"], label=r["label"], index=r["idx"])
-            for r in conn.execute("SELECT * FROM pages").fetchall()
+            for r in conn.execute("SELECT * FROM pages")
         ]
         sections = [
             SectionSpan(
@@ -1386,11 +1431,11 @@ class ScholarDocument:
                 level=r["level"],
                 confidence=r["confidence"],
             )
-            for r in conn.execute("SELECT * FROM sections").fetchall()
+            for r in conn.execute("SELECT * FROM sections")
         ]
         paragraphs = [
             ParagraphSpan(start=r["start"], end=r["end_pos"])
-            for r in conn.execute("SELECT * FROM paragraphs").fetchall()
+            for r in conn.execute("SELECT * FROM paragraphs")
         ]
         block_quotes = [
             BlockQuoteSpan(
@@ -1398,7 +1443,7 @@ class ScholarDocument:
                 end=r["end_pos"],
                 indentation_level=r["indentation_level"],
             )
-            for r in conn.execute("SELECT * FROM block_quotes").fetchall()
+            for r in conn.execute("SELECT * FROM block_quotes")
         ]
 
         # Notes
@@ -1410,7 +1455,7 @@ class ScholarDocument:
                 page_label=r["page_label"],
                 source=NoteSource(r["source"]),
             )
-            for r in conn.execute("SELECT * FROM notes").fetchall()
+            for r in conn.execute("SELECT * FROM notes")
         }
 
         # Bibliography
@@ -1422,7 +1467,7 @@ class ScholarDocument:
                 title=r["title"],
                 year=r["year"],
             )
-            for r in conn.execute("SELECT * FROM bibliography").fetchall()
+            for r in conn.execute("SELECT * FROM bibliography")
         ]
 
         # ToC entries
@@ -1430,8 +1475,7 @@ class ScholarDocument:
 
         # Processing log
         processing_log = [
-            r["entry"]
-            for r in conn.execute("SELECT entry FROM processing_log ORDER BY idx").fetchall()
+            r["entry"] for r in conn.execute("SELECT entry FROM processing_log ORDER BY idx")
         ]
 
         # Build metadata
@@ -116,6 +116,14 @@ COMMON_OCR_MISSPELLINGS = {
     "rnorning": "morning",
 }
 
+# Compiled once at import; correct_known_patterns runs on every page.
+# One alternation finds every known misspelling in a single scan.
+_MISSPELLING_PATTERN = re.compile(
+    rf"\b(?:{'|'.join(COMMON_OCR_MISSPELLINGS)})\b",
+    re.IGNORECASE,
+)
+_BROKEN_HYPHEN_PATTERN = re.compile(r"(\w+)-\s+(\w+)")
+
 # Philosophy/scholarly vocabulary - don't flag these as misspellings
 # These are valid terms that spell checkers often don't recognize
 PHILOSOPHY_VOCABULARY = {
@@ -776,7 +784,7 @@ class CorrectionConfig:
 DEFAULT_CORRECTION_CONFIG = CorrectionConfig()
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionCandidate:
     """Analysis of a potential correction."""
 
@@ -1162,30 +1170,26 @@ def correct_known_patterns(text: str) -> CorrectionResult:
     result = text
 
     # Fix known misspellings
-    for wrong, right in COMMON_OCR_MISSPELLINGS.items():
-        pattern = re.compile(rf"\b{wrong}\b", re.IGNORECASE)
-        matches = pattern.findall(result)
-        if matches:
-            for match in matches:
-                # Preserve original case
-                if match[0].isupper():
-                    replacement = right.capitalize()
-                else:
-                    replacement = right
-                changes.append((match, replacement))
-            result = pattern.sub(
-                lambda m, r=right: r.capitalize() if m.group()[0].isupper() else r,
-                result,
-            )
+    def fix_misspelling(m: re.Match[str]) -> str:
+        match = m.group()
+        # casefold() mirrors IGNORECASE matching when looking up the entry
+        right = COMMON_OCR_MISSPELLINGS[match.casefold()]
+        # Preserve original case
+        replacement = right.capitalize() if match[0].isupper() else right
+        changes.append((match, replacement))
+        return replacement
+
+    result = _MISSPELLING_PATTERN.sub(fix_misspelling, result)
 
     # Fix broken hyphenation (word- continuation)
-    hyphen_pattern = re.compile(r"(\w+)-\s+(\w+)")
-    for match in hyphen_pattern.finditer(text):
+    recorded = {c[0] for c in changes}
+    for match in _BROKEN_HYPHEN_PATTERN.finditer(text):
         original = match.group(0)
         fixed = match.group(1) + match.group(2)
-        if original not in [c[0] for c in changes]:
+        if original not in recorded:
+            recorded.add(original)
             changes.append((original, fixed))
-    result = hyphen_pattern.sub(r"\1\2", result)
+    result = _BROKEN_HYPHEN_PATTERN.sub(r"\1\2", result)
 
     return CorrectionResult(
         original_text=text,
@@ -47,6 +47,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Patterns used per word; compiled once rather than looked up on every call
+WORD_PATTERN = re.compile(r"^[a-zA-ZäöüÄÖÜßàâçéèêëîïôùûü]+$")
+JOINED_WORD_PATTERN = re.compile(r"^[a-zA-ZäöüÄÖÜß]+$")
+TRIPLE_LETTER_PATTERN = re.compile(r"(.)\1\1")
+VOWEL_PATTERN = re.compile(r"[aeiouäöü]")
+NON_WORD_PATTERN = re.compile(r"[^\w]")
+
 
 # =============================================================================
 # ADAPTIVE DICTIONARY
@@ -198,7 +205,7 @@ class AdaptiveDictionary:
     def _check_pattern(self, word: str) -> float:
         """Check if word follows valid character patterns."""
         # Must be all letters (allow some diacritics)
-        if not re.match(r"^[a-zA-ZäöüÄÖÜßàâçéèêëîïôùûü]+$", word):
+        if not WORD_PATTERN.match(word):
             return 0.0
 
         # Reasonable length
@@ -206,11 +213,11 @@ class AdaptiveDictionary:
             return 0.0
 
         # No triple letters (usually OCR error)
-        if re.search(r"(.)\1\1", word):
+        if TRIPLE_LETTER_PATTERN.search(word):
             return 0.0
 
         # Has vowels (probably pronounceable)
-        if not re.search(r"[aeiouäöü]", word.lower()):
+        if not VOWEL_PATTERN.search(word.lower()):
             return 0.2  # Low confidence for consonant-only
 
         return 0.7
@@ -276,7 +283,7 @@ class AdaptiveDictionary:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LineBreakCandidate:
     """A potential line-break hyphenation to rejoin."""
 
@@ -393,7 +400,7 @@ class LineBreakRejoiner:
         """Evaluate whether two fragments should be joined."""
         # Clean the fragments
         clean_frag1 = fragment1.rstrip("-")
-        clean_frag2 = re.sub(r"[^\w]", "", fragment2)  # Strip punctuation
+        clean_frag2 = NON_WORD_PATTERN.sub("", fragment2)  # Strip punctuation
 
         joined = clean_frag1 + clean_frag2
 
@@ -401,7 +408,7 @@ class LineBreakRejoiner:
         is_valid, confidence = self.dictionary.is_probably_word(joined)
 
         # Position signal boost: hyphen at line end is strong evidence
-        pattern_ok = bool(re.match(r"^[a-zA-ZäöüÄÖÜß]+$", joined))
+        pattern_ok = bool(JOINED_WORD_PATTERN.match(joined))
         reasonable_length = 3 <= len(joined) <= 25
 
         if is_valid:
@@ -458,7 +465,7 @@ class LineBreakRejoiner:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRErrorCandidate:
     """A word flagged as potential OCR error for re-OCR."""
 
@@ -558,7 +565,7 @@ class OCRErrorDetector:
 
         for i, word in enumerate(words):
             # Clean word
-            clean = re.sub(r"[^\w]", "", word).lower()
+            clean = NON_WORD_PATTERN.sub("", word).lower()
             if len(clean) < 2:
                 continue
 
@@ -16,6 +16,7 @@ import logging
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -36,6 +37,9 @@ MIN_WORD_LENGTH = 2
 # Pattern to extract words from text
 WORD_EXTRACTION_PATTERN = re.compile(r"\b[\w']+\b")
 
+# Characters stripped when cleaning a word (apostrophes are kept)
+NON_WORD_CHAR_PATTERN = re.compile(r"[^\w']")
+
 # Scholarly vocabulary to skip (reduces false positives)
 # German philosophy
 GERMAN_TERMS = frozenset(
@@ -222,12 +226,31 @@ GREEK_TERMS = frozenset(
 SCHOLARLY_VOCAB = GERMAN_TERMS | FRENCH_TERMS | LATIN_TERMS | GREEK_TERMS
 
 
+def _normalize_token(word: str) -> str:
+    """NFC-normalize and lowercase a token for comparison."""
+    # NFC normalization ensures ü is U+00FC, not U+0075 U+0308
+    return unicodedata.normalize("NFC", word).lower()
+
+
+@lru_cache(maxsize=8192)
+def _clean_token(word: str) -> str:
+    """Strip punctuation from a token, then NFC-normalize and lowercase it.
+
+    Pure function of the token; cached because running text repeats the
+    same tokens ("the", "of", ...) far more often than it introduces new ones.
+    """
+    # Remove non-word characters except apostrophes, then leading/trailing
+    # apostrophes
+    clean = NON_WORD_CHAR_PATTERN.sub("", word).strip("'")
+    return _normalize_token(clean)
+
+
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRErrorCandidate:
     """A word flagged as potential OCR error."""
 
@@ -308,9 +331,7 @@ class OCRErrorDetector:
         Returns:
             Normalized word.
         """
-        # NFC normalization ensures ü is U+00FC, not U+0075 U+0308
-        normalized = unicodedata.normalize("NFC", word)
-        return normalized.lower()
+        return _normalize_token(word)
 
     def _clean_word(self, word: str) -> str:
         """
@@ -322,11 +343,7 @@ class OCRErrorDetector:
         Returns:
             Cleaned word (lowercase, no punctuation).
         """
-        # Remove non-word characters except apostrophes
-        clean = re.sub(r"[^\w']", "", word)
-        # Remove leading/trailing apostrophes
-        clean = clean.strip("'")
-        return self._normalize_word(clean)
+        return _clean_token(word)
 
     def is_error(self, word: str) -> bool:
         """
@@ -32,6 +32,12 @@ logger = logging.getLogger(__name__)
 # Word pattern for validation
 WORD_PATTERN = re.compile(r"^[a-zA-ZäöüÄÖÜß]+$")
 
+# Punctuation stripped from the second fragment before joining
+NON_WORD_PATTERN = re.compile(r"[^\w]")
+
+# Hyphenated line break in plain text ("word-\n" continuation)
+HYPHENATED_BREAK_PATTERN = re.compile(r"(\w+)-\s*\n\s*(\w+)")
+
 # Confidence thresholds
 MIN_CONFIDENCE_TO_JOIN = 0.3
 POSITION_SIGNAL_BOOST = 0.6
@@ -47,7 +53,7 @@ MIN_FRAGMENT_LENGTH = 2
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LineBreakCandidate:
     """A potential line-break hyphenation to rejoin."""
 
@@ -197,7 +203,7 @@ class LineBreakRejoiner:
         """
         # Clean the fragments
         clean_frag1 = fragment1.rstrip("-")
-        clean_frag2 = re.sub(r"[^\w]", "", fragment2)  # Strip punctuation
+        clean_frag2 = NON_WORD_PATTERN.sub("", fragment2)  # Strip punctuation
 
         joined = clean_frag1 + clean_frag2
 
@@ -269,9 +275,8 @@ class LineBreakRejoiner:
         if candidates is None:
             # Simple pattern-based detection for plain text
             # Look for "word-\\n" patterns
-            pattern = re.compile(r"(\w+)-\s*\n\s*(\w+)")
             candidates = []
-            for match in pattern.finditer(text):
+            for match in HYPHENATED_BREAK_PATTERN.finditer(text):
                 fragment1 = match.group(1) + "-"
                 fragment2 = match.group(2)
                 candidate = self.evaluate_join(fragment1, fragment2)
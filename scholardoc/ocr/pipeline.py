@@ -18,10 +18,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from PIL import Image
-
 if TYPE_CHECKING:
     import fitz
+    from PIL import Image
 
 from scholardoc.ocr.detector import DetectionStats, OCRErrorCandidate, OCRErrorDetector
 from scholardoc.ocr.dictionary import AdaptiveDictionary
@@ -16,14 +16,14 @@ from __future__ import annotations
 
 import io
 import logging
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from PIL import Image
-
 if TYPE_CHECKING:
     import fitz
+    from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -285,6 +285,7 @@ class HybridReOCREngine:
         """
         mat_scale = self.dpi / 72.0
         import fitz as fitz_module
+        from PIL import Image
 
         mat = fitz_module.Matrix(mat_scale, mat_scale)
         pix = page.get_pixmap(matrix=mat)
@@ -510,8 +511,6 @@ class HybridReOCREngine:
         Returns:
             Tuple of (results list, statistics).
         """
-        import time
-
         start_time = time.time()
         results = []
         stats = ReOCRStats(engine_used=self._get_active_engine())
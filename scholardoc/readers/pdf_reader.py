@@ -11,17 +11,19 @@ by the extractors module (CascadingExtractor).
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import fitz  # PyMuPDF
-
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    import fitz  # PyMuPDF
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextBlock:
     """A block of text with position and font information.
 
@@ -52,7 +54,7 @@ class TextBlock:
         return self.y1 - self.y0
 
 
-@dataclass
+@dataclass(slots=True)
 class PageData:
     """Raw data extracted from a single PDF page."""
 
@@ -65,7 +67,7 @@ class PageData:
     has_images: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlineEntry:
     """An entry from the PDF outline/bookmarks.
 
@@ -99,11 +101,7 @@ class RawDocument:
     def text(self) -> str:
         """Full document text (cached)."""
         if self._text_cache is None:
-            parts = []
-            for page in self.pages:
-                if page.text:
-                    parts.append(page.text)
-            self._text_cache = "\n\n".join(parts)
+            self._text_cache = "\n\n".join(page.text for page in self.pages if page.text)
         return self._text_cache
 
     @property
@@ -125,9 +123,12 @@ class RawDocument:
 
     def page_for_position(self, pos: int) -> int | None:
         """Find page index containing a text position."""
-        for i, (start, end) in enumerate(self.page_positions):
-            if start <= pos < end:
-                return i
+        # Page starts are strictly increasing, so the only candidate is the
+        # last page starting at or before pos.
+        positions = self.page_positions
+        i = bisect_right(positions, pos, key=lambda span: span[0]) - 1
+        if i >= 0 and pos < positions[i][1]:
+            return i
         return None
 
     def position_to_page(self, page_index: int) -> int:
@@ -188,6 +189,9 @@ class PDFReader:
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {path}")
 
+        # Imported here so that importing scholardoc does not load PyMuPDF
+        import fitz
+
         try:
             doc = fitz.open(path)
         except Exception as e:
@@ -250,6 +254,8 @@ class PDFReader:
 
     def _extract_blocks(self, page: fitz.Page, page_idx: int) -> list[TextBlock]:
         """Extract text blocks with position and font info."""
+        import fitz
+
         blocks = []
 
         # Get detailed text extraction with font info
@@ -269,14 +275,15 @@ class PDFReader:
 
                     font = span.get("font", "")
                     flags = span.get("flags", 0)
+                    x0, y0, x1, y1 = span.get("bbox", (0, 0, 0, 0))
 
                     blocks.append(
                         TextBlock(
                             text=text,
-                            x0=span.get("bbox", [0, 0, 0, 0])[0],
-                            y0=span.get("bbox", [0, 0, 0, 0])[1],
-                            x1=span.get("bbox", [0, 0, 0, 0])[2],
-                            y1=span.get("bbox", [0, 0, 0, 0])[3],
+                            x0=x0,
+                            y0=y0,
+                            x1=x1,
+                            y1=y1,
                             font_name=font,
                             font_size=span.get("size", 0),
                             is_bold=bool(flags & 2**4),  # Bold flag
@@ -403,18 +410,13 @@ def get_font_statistics(raw: RawDocument) -> dict[str, float]:
 
 def detect_body_font_size(raw: RawDocument) -> float:
     """Detect the most common (body text) font size."""
-    from collections import Counter
-
-    sizes = []
-    for page in raw.pages:
-        for block in page.blocks:
-            # Round to 0.5pt for grouping
-            sizes.append(round(block.font_size * 2) / 2)
+    # Round to 0.5pt for grouping; Counter consumes the sizes directly
+    # rather than via an intermediate list of every block's size
+    counter = Counter(round(block.font_size * 2) / 2 for page in raw.pages for block in page.blocks)
 
-    if not sizes:
+    if not counter:
         return 12.0  # Default
 
-    counter = Counter(sizes)
     return counter.most_common(1)[0][0]
 
 
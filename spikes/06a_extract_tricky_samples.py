@@ -582,11 +582,11 @@ def extract_block_quotes(doc: fitz.Document, pdf_name: str, max_samples: int = 1
 
                 # Check if significantly indented (block quote indicator)
                 if x0 > 100:  # Arbitrary threshold for indentation
-                    text = ""
+                    parts = []
                     for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            text += span.get("text", "")
-                        text += " "
+                        parts.extend(span.get("text", "") for span in line.get("spans", []))
+                        parts.append(" ")
+                    text = "".join(parts)
 
                     if len(text.strip()) > 50:  # Substantial text
                         if len(samples) >= max_samples:
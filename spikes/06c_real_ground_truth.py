@@ -609,7 +609,10 @@ class RealGroundTruthExtractor:
         # Save as YAML for easy editing
         import yaml
         with open(output_path, 'w') as f:
-            yaml.dump(annotations, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                annotations, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                default_flow_style=False, allow_unicode=True,
+            )
 
         print(f"Created annotation file: {output_path}")
         print(f"Found {len(annotations['annotations'])} words for review")
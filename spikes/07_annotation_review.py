@@ -47,6 +47,10 @@ except ImportError:
     fitz = None
     print("Note: Install PyMuPDF for visual review: uv add pymupdf")
 
+# libyaml-backed loader/dumper when PyYAML was built with it (same safe semantics)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # ============================================================================
 # Data Models
@@ -72,14 +76,19 @@ class ReviewStats:
 
 def load_annotations(path: str) -> dict:
     """Load annotations from YAML file."""
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+    # Read the whole file so the C loader parses one buffer instead of
+    # calling back into Python for each read
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=YAML_LOADER)
 
 
 def save_annotations(annotations: dict, path: str):
     """Save annotations to YAML file."""
     with open(path, 'w') as f:
-        yaml.dump(annotations, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            annotations, f, Dumper=YAML_DUMPER,
+            default_flow_style=False, sort_keys=False, allow_unicode=True,
+        )
 
 
 def get_items_needing_review(annotations: dict) -> list[dict]:
@@ -139,6 +139,48 @@ class TestConvertAPI:
         results = list(convert_batch([]))
         assert results == []
 
+    def test_convert_batch_parallel_yields_errors_in_order(self):
+        """convert_batch(parallel=True) yields per-file errors in input order."""
+        from scholardoc import convert_batch
+
+        sources = ["missing_a.pdf", "missing_b.pdf", "missing_c.pdf"]
+        results = list(convert_batch(sources, parallel=True, max_workers=2))
+
+        assert [path.name for path, _ in results] == sources
+        assert all(isinstance(result, FileNotFoundError) for _, result in results)
+
+    def test_convert_batch_parallel_broken_pool(self, monkeypatch):
+        """convert_batch(parallel=True) reports dead workers as per-file errors."""
+        import importlib
+        import multiprocessing
+        import os
+        from concurrent.futures.process import BrokenProcessPool
+
+        from scholardoc import convert_batch
+
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("workers only inherit the patched convert() when forked")
+
+        def crash(source, config):
+            os._exit(1)
+
+        # scholardoc.convert is shadowed by the re-exported function
+        convert_module = importlib.import_module("scholardoc.convert")
+        monkeypatch.setattr(convert_module, "convert", crash)
+        sources = ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+        results = list(convert_batch(sources, parallel=True, max_workers=2))
+
+        assert [path.name for path, _ in results] == sources
+        assert all(isinstance(result, BrokenProcessPool) for _, result in results)
+
+    def test_convert_batch_parallel_skip(self):
+        """convert_batch(parallel=True) drops failures when configured to skip."""
+        from scholardoc import ConversionConfig, convert_batch
+
+        config = ConversionConfig(on_extraction_error="skip")
+        results = list(convert_batch(["a.pdf", "b.pdf"], config, parallel=True))
+        assert results == []
+
     def test_detect_format_pdf(self):
         """detect_format() detects PDF from extension."""
         from scholardoc import detect_format
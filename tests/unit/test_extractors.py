@@ -20,7 +20,7 @@ from scholardoc.extractors import (
     ToCParserSource,
 )
 from scholardoc.models import SectionSpan
-from scholardoc.readers import PDFReader, RawDocument
+from scholardoc.readers import PageData, PDFReader, RawDocument
 
 # Test fixtures
 SAMPLE_PDFS = Path(__file__).parent.parent.parent / "spikes" / "sample_pdfs"
@@ -174,6 +174,23 @@ class TestToCParserSource:
         candidates = source.extract(raw_doc)
         assert isinstance(candidates, list)
 
+    def test_page_reference_resolves_first_matching_label(self):
+        """Page refs beyond the page count resolve via the first matching label."""
+        texts = ["Contents\nChapter One ....... 101\n", "Body text", "More body text"]
+        pages = [
+            PageData(
+                index=i, label=label, width=0, height=0, text=text, blocks=[], has_images=False
+            )
+            for i, (label, text) in enumerate(zip(["v", "101", "101"], texts, strict=True))
+        ]
+        doc = RawDocument(
+            source_path=Path("x.pdf"), page_count=3, pages=pages, outline=[], metadata={}
+        )
+
+        candidates = ToCParserSource().extract(doc)
+
+        assert [(c.title, c.page_index) for c in candidates] == [("Chapter One", 1)]
+
 
 class TestNoOverlapValidator:
     """Test overlap validation."""
@@ -335,6 +352,62 @@ class TestCascadingExtractor:
         assert isinstance(result.validation_issues, list)
 
 
+def _candidate(title: str, page_index: int, start: int = 0) -> SectionCandidate:
+    """Build a minimal section candidate for enrichment tests."""
+    return SectionCandidate(
+        start=start,
+        end=None,
+        title=title,
+        level=1,
+        confidence=0.9,
+        source="heading_detection",
+        page_index=page_index,
+    )
+
+
+class TestTitleEnrichment:
+    """Test ToC title enrichment in the cascading extractor."""
+
+    def test_enriches_from_adjacent_page(self, raw_doc):
+        """A similar ToC entry one page away replaces the detected title."""
+        extractor = CascadingExtractor()
+        toc = [_candidate("Chapter One: Introduction", page_index=4)]
+        sections = extractor._candidates_to_sections(
+            [_candidate("CHAPTER ONE: lNTRODUCTION", page_index=5)], toc, raw_doc, []
+        )
+        assert sections[0].title == "Chapter One: Introduction"
+
+    def test_ignores_distant_pages(self, raw_doc):
+        """ToC entries more than one page away are never used."""
+        extractor = CascadingExtractor()
+        toc = [_candidate("Chapter One: Introduction", page_index=7)]
+        sections = extractor._candidates_to_sections(
+            [_candidate("CHAPTER ONE: lNTRODUCTION", page_index=5)], toc, raw_doc, []
+        )
+        assert sections[0].title == "CHAPTER ONE: lNTRODUCTION"
+
+    def test_respects_similarity_threshold(self, raw_doc):
+        """Dissimilar ToC entries on the same page are not used."""
+        extractor = CascadingExtractor()
+        toc = [_candidate("Preface", page_index=5)]
+        sections = extractor._candidates_to_sections(
+            [_candidate("Chapter One", page_index=5)], toc, raw_doc, []
+        )
+        assert sections[0].title == "Chapter One"
+
+    def test_tie_prefers_earliest_toc_entry(self, raw_doc):
+        """Equally similar entries resolve to the first in ToC order."""
+        extractor = CascadingExtractor()
+        toc = [
+            _candidate("Chapter 1 Method", page_index=6),
+            _candidate("Chapter 1 method", page_index=4),
+        ]
+        sections = extractor._candidates_to_sections(
+            [_candidate("CHAPTER 1 METHOD", page_index=5)], toc, raw_doc, []
+        )
+        assert sections[0].title == "Chapter 1 Method"
+
+
 class TestExtractStructureFunction:
     """Test convenience function."""
 
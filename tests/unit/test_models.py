@@ -383,6 +383,23 @@ class TestScholarDocumentQueries:
         assert "1" in labels
         assert "2" in labels
 
+    def test_page_lookup_with_gaps_between_pages(self):
+        """Page lookups skip the separators between page spans."""
+        pages = [
+            PageSpan(start=0, end=10, label="1", index=0),
+            PageSpan(start=12, end=20, label="2", index=1),
+            PageSpan(start=22, end=30, label="3", index=2),
+        ]
+        doc = ScholarDocument(text="x" * 30, pages=pages)
+
+        for pos in range(-1, 32):
+            expected = next((p for p in pages if p.start <= pos < p.end), None)
+            assert doc.page_for_position(pos) == expected
+        for start in range(0, 31):
+            for end in range(start, 32):
+                expected = [p for p in pages if p.start < end and start < p.end]
+                assert doc.pages_in_range(start, end) == expected
+
     def test_section_for_position(self, document_with_structure):
         """section_for_position finds correct section."""
         doc = document_with_structure
@@ -399,6 +416,22 @@ class TestScholarDocumentQueries:
         assert fn_ref.marker == "1"
         assert note.text == "First footnote"
 
+    def test_footnotes_in_range_unsorted_refs(self):
+        """footnotes_in_range finds refs stored out of position order."""
+        refs = [
+            FootnoteRef(position=20, marker="3", target_id="fn3"),
+            FootnoteRef(position=5, marker="1", target_id="fn1"),
+            FootnoteRef(position=12, marker="2", target_id="fn2"),
+        ]
+        notes = {fn.target_id: Note(id=fn.target_id, text=fn.marker) for fn in refs}
+        doc = ScholarDocument(text="x" * 30, footnote_refs=refs, notes=notes)
+
+        for start in range(0, 31):
+            for end in range(start, 32):
+                expected = sorted(fn.position for fn in refs if start <= fn.position < end)
+                found = [fn.position for fn, _ in doc.footnotes_in_range(start, end)]
+                assert found == expected
+
     def test_citations_in_range(self, document_with_structure):
         """citations_in_range finds overlapping citations."""
         doc = document_with_structure
@@ -730,6 +763,20 @@ class TestScholarDocumentPersistence:
         doc.save(save_path)
         assert (tmp_path / "test.scholardoc").exists()
 
+    def test_save_compact_roundtrip(self, complete_document, tmp_path):
+        """save(compact=True) writes smaller JSON that loads identically."""
+        doc = complete_document
+        pretty_path = tmp_path / "pretty.scholardoc"
+        compact_path = tmp_path / "compact.scholardoc"
+
+        doc.save(pretty_path)
+        doc.save(compact_path, compact=True)
+
+        assert compact_path.stat().st_size < pretty_path.stat().st_size
+        assert "\n" not in compact_path.read_text(encoding="utf-8")
+        loaded = ScholarDocument.load(compact_path)
+        assert loaded._to_dict() == ScholarDocument.load(pretty_path)._to_dict()
+
     def test_saved_file_is_valid_json(self, complete_document, tmp_path):
         """Saved file is valid JSON."""
         doc = complete_document
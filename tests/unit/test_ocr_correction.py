@@ -117,6 +117,12 @@ class TestKnownPatternCorrection:
         assert "beautiful" in result.corrected_text.lower()
         assert "-" not in result.corrected_text or "beau-" not in result.corrected_text
 
+    def test_repeated_hyphenation_recorded_once(self):
+        """A hyphenation break occurring twice is listed once in changes."""
+        result = correct_known_patterns("The beau- tiful sunset and beau- tiful dawn.")
+        assert result.corrected_text == "The beautiful sunset and beautiful dawn."
+        assert result.changes_made == [("beau- tiful", "beautiful")]
+
     def test_case_preserved(self):
         """Corrections should preserve original case."""
         result = correct_known_patterns("The Beautlful sunset.")
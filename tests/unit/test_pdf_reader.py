@@ -231,6 +231,21 @@ class TestRawDocumentQueries:
         # Position beyond text should return None
         assert raw.page_for_position(len(raw.text) + 1000) is None
 
+    def test_page_for_position_separators_and_empty_pages(self):
+        """page_for_position skips separators and empty pages."""
+        pages = [
+            PageData(
+                index=i, label=str(i), width=0, height=0, text=text, blocks=[], has_images=False
+            )
+            for i, text in enumerate(["abc", "", "de"])
+        ]
+        raw = RawDocument(
+            source_path=Path("x.pdf"), page_count=3, pages=pages, outline=[], metadata={}
+        )
+        # Page spans: (0, 3), (5, 5), (7, 9)
+        expected = [0, 0, 0, None, None, None, None, 2, 2, None]
+        assert [raw.page_for_position(pos) for pos in range(10)] == expected
+
     def test_position_to_page(self, reader, small_pdf):
         """position_to_page returns page start position."""
         raw = reader.read(small_pdf)